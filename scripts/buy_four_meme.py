@@ -5,7 +5,9 @@ Buy a four.meme token on BNB Chain (PancakeSwap V2) using a local wallet.
 Features:
 - Swaps native BNB -> token via best of [WBNB -> token], [WBNB -> USDT -> token], [WBNB -> USDC -> token]
 - Slippage control, deadline, custom RPC, custom gas price
+- Optional parallel broadcast of the signed tx to several RPC endpoints
 - Dry-run mode to preview expected output and path
+- Aggressive mode (--aggressive or AGGRESSIVE_SNIPE=1): skip quoting and gas estimation, direct path, no min-out
 
 Usage examples:
   python3 scripts/buy_four_meme.py --token 0x... --amount-bnb 0.02 --slippage 10 --rpc https://bsc-dataseed.binance.org \
@@ -17,15 +19,34 @@ NOTE: Keep your private key safe. Prefer environment variables over CLI args on
 """
 
 import argparse
+import asyncio
+import functools
+import json
 import os
+import sqlite3
 import sys
 import time
 from decimal import Decimal, getcontext
-from typing import List, Optional, Tuple
-
+from typing import Any, Dict, List, Optional, Tuple
+
+import aiohttp
+import requests
+import websockets
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from eth_abi import decode as abi_decode
+from eth_abi import encode as abi_encode
+from hexbytes import HexBytes
 from web3 import Web3
 from web3.contract import Contract
-from web3.exceptions import ContractLogicError
+from web3.exceptions import TimeExhausted, TransactionNotFound
+
+# eth-keys signs with libsecp256k1 via coincurve when it is importable and silently
+# falls back to pure-Python ECDSA otherwise; surface the slow path up front
+try:
+    import coincurve  # noqa: F401
+except ImportError:
+    print("[WARN] coincurve not installed; transaction signing will use the slow pure-Python backend")
 
 # Increase decimal precision for accurate human -> wei conversions
 getcontext().prec = 50
@@ -37,6 +58,42 @@ WBNB = Web3.to_checksum_address("0xbb4CdB9CBd36B01bD1cBaEBF2De08d9173bc095c")
 USDT = Web3.to_checksum_address("0x55d398326f99059fF775485246999027B3197955")
 USDC = Web3.to_checksum_address("0x8ac76a51cc950d9822d68b83fe1ad97b32cd580d")
 COMMON_INTERMEDIARIES: List[str] = [USDT, USDC]
+# Multicall3 (same address on every EVM chain it is deployed to)
+MULTICALL3 = Web3.to_checksum_address("0xcA11bde05977b3631167028862bE2a173976CA11")
+
+# Precomputed selector for the swap, so calldata is built without walking the router ABI
+SWAP_ETH_FOR_TOKENS_SELECTOR = Web3.keccak(
+    text="swapExactETHForTokensSupportingFeeOnTransferTokens(uint256,address[],address,uint256)"
+)[:4]
+
+# Persistent cache of immutable token metadata, shared across invocations
+TOKEN_CACHE_PATH = os.path.join(os.path.expanduser("~"), ".cache", "buy_four_meme", "tokens.sqlite")
+
+# One pooled keep-alive session shared by the Web3 provider and batch RPC calls,
+# so only the first request pays for the TCP + TLS handshake
+_RPC_ADAPTER = HTTPAdapter(
+    pool_connections=4,
+    pool_maxsize=8,
+    # Only explicit 429/5xx answers are retried (JSON-RPC is POST-only, hence allowed_methods).
+    # Connect/read failures are not, so a hung node costs one timeout rather than four.
+    max_retries=Retry(
+        total=3,
+        connect=0,
+        read=0,
+        other=0,
+        status=3,
+        backoff_factor=0.3,
+        status_forcelist=[429, 500, 502, 503, 504],
+        allowed_methods=frozenset({"POST"}),
+    ),
+)
+_RPC_SESSION = requests.Session()
+# Plain http:// too, e.g. a local node at http://127.0.0.1:8545
+_RPC_SESSION.mount("https://", _RPC_ADAPTER)
+_RPC_SESSION.mount("http://", _RPC_ADAPTER)
+# Raw tx submission never retries: a resend after an ambiguous failure gets "already known"
+# and would be reported as an error for a tx that was in fact broadcast
+_SEND_SESSION = requests.Session()
 
 # Minimal ABIs
 ROUTER_ABI = [
@@ -64,6 +121,37 @@ ROUTER_ABI = [
     },
 ]
 
+MULTICALL3_ABI = [
+    {
+        "inputs": [
+            {
+                "components": [
+                    {"internalType": "address", "name": "target", "type": "address"},
+                    {"internalType": "bool", "name": "allowFailure", "type": "bool"},
+                    {"internalType": "bytes", "name": "callData", "type": "bytes"},
+                ],
+                "internalType": "struct Multicall3.Call3[]",
+                "name": "calls",
+                "type": "tuple[]",
+            }
+        ],
+        "name": "aggregate3",
+        "outputs": [
+            {
+                "components": [
+                    {"internalType": "bool", "name": "success", "type": "bool"},
+                    {"internalType": "bytes", "name": "returnData", "type": "bytes"},
+                ],
+                "internalType": "struct Multicall3.Result[]",
+                "name": "returnData",
+                "type": "tuple[]",
+            }
+        ],
+        "stateMutability": "payable",
+        "type": "function",
+    },
+]
+
 ERC20_ABI = [
     {
         "constant": False,
@@ -89,6 +177,7 @@ ERC20_ABI = [
 def parse_args() -> argparse.Namespace:
     parser = argparse.ArgumentParser(description="Buy token on BNB Chain via PancakeSwap V2 using local wallet")
     parser.add_argument("--rpc", default="https://bsc-dataseed.binance.org", help="BNB Chain RPC URL")
+    parser.add_argument("--rpc-timeout", default=5, type=float, help="Per-request RPC timeout in seconds (no retries)")
     parser.add_argument("--token", required=True, help="Token address to buy (checksum or hex)")
     parser.add_argument("--amount-bnb", required=True, type=str, help="Amount of native BNB to spend, e.g., 0.02")
     parser.add_argument("--slippage", default="10", type=str, help="Max slippage percent, e.g., 10 = 10%")
@@ -99,6 +188,20 @@ def parse_args() -> argparse.Namespace:
     parser.add_argument("--nonce", default=None, type=int, help="Override nonce")
     parser.add_argument("--dry-run", action="store_true", help="Compute path/amounts but do not send tx")
     parser.add_argument("--no-wait", action="store_true", help="Do not wait for receipt after sending")
+    parser.add_argument(
+        "--broadcast-rpc",
+        default=os.environ.get("BSC_RPC_URLS"),
+        help="Comma-separated extra RPC URLs to send the signed tx to in parallel (env BSC_RPC_URLS)",
+    )
+    parser.add_argument(
+        "--ws-rpc", default=None, help="WebSocket RPC URL; wait for the receipt via newHeads instead of polling"
+    )
+    parser.add_argument(
+        "--aggressive",
+        action="store_true",
+        default=os.environ.get("AGGRESSIVE_SNIPE") == "1",
+        help="Skip quotes and gas estimation; buy via [WBNB, token] with amountOutMin=0 (env AGGRESSIVE_SNIPE=1)",
+    )
     return parser.parse_args()
 
 
@@ -113,62 +216,236 @@ def bnb_to_wei(amount_bnb_str: str) -> int:
     return int((amount * (Decimal(10) ** 18)).to_integral_value())
 
 
-def connect_web3(rpc: str) -> Web3:
-    w3 = Web3(Web3.HTTPProvider(rpc, request_kwargs={"timeout": 30}))
+@functools.lru_cache(maxsize=None)
+def get_chain_id(w3: Web3) -> int:
+    # Fixed for the lifetime of a provider; fetched once in connect_web3, which also
+    # drops web3's per-call chain id validation
+    return w3.eth.chain_id
+
+
+def connect_web3(rpc: str, timeout: float) -> Web3:
+    provider = Web3.HTTPProvider(rpc, request_kwargs={"timeout": timeout}, session=_RPC_SESSION)
+    # web3's retry middleware re-sends timed-out calls up to 5 times; fail fast instead and
+    # leave retries to the session adapter (which only retries 429/5xx responses with backoff).
+    # Provider middlewares are the web3 v6 mechanism, hence the <7 pin in requirements.txt.
+    provider.middlewares = ()
+    w3 = Web3(provider)
+    # The default validation middleware fetches eth_chainId before every eth_call/estimateGas;
+    # chain id is checked once below and cached by get_chain_id instead
+    w3.middleware_onion.remove("validation")
     if not w3.is_connected():
         raise RuntimeError(f"Failed to connect to RPC: {rpc}")
-    chain_id = w3.eth.chain_id
+    chain_id = get_chain_id(w3)
     if chain_id != 56:
         print(f"[WARN] Connected chain_id={chain_id}, expected 56 (BNB Chain mainnet)")
     return w3
 
 
+def rpc_call(w3: Web3, method: str, params: list, session: requests.Session = _RPC_SESSION) -> Any:
+    """Send a single JSON-RPC request to the provider endpoint over the given session."""
+    timeout = dict(w3.provider.get_request_kwargs()).get("timeout")
+    resp = session.post(
+        w3.provider.endpoint_uri,
+        json={"jsonrpc": "2.0", "id": 0, "method": method, "params": params},
+        timeout=timeout,
+    )
+    resp.raise_for_status()
+    body = resp.json()
+    if "error" in body:
+        raise RuntimeError(f"RPC {method} failed: {body['error']}")
+    return body["result"]
+
+
+def rpc_batch(w3: Web3, calls: List[Tuple[str, list]]) -> List[Any]:
+    """Send several JSON-RPC requests in a single HTTP round-trip and return results in order."""
+    payload = [
+        {"jsonrpc": "2.0", "id": idx, "method": method, "params": params}
+        for idx, (method, params) in enumerate(calls)
+    ]
+    timeout = dict(w3.provider.get_request_kwargs()).get("timeout")
+    resp = _RPC_SESSION.post(w3.provider.endpoint_uri, json=payload, timeout=timeout)
+    try:
+        resp.raise_for_status()
+        body = resp.json()
+    except (requests.HTTPError, ValueError):
+        body = None
+    by_id = {item.get("id"): item for item in body if isinstance(item, dict)} if isinstance(body, list) else {}
+    if any(idx not in by_id for idx in range(len(calls))):
+        # Endpoints that reject or limit batches answer with a non-2xx status, a non-JSON body,
+        # a single error object or an id-less error entry; ask for each call on its own instead
+        return [rpc_call(w3, method, params) for method, params in calls]
+    results: List[Any] = []
+    for idx, (method, _) in enumerate(calls):
+        item = by_id[idx]
+        if "error" in item:
+            raise RuntimeError(f"Batch RPC {method} failed: {item['error']}")
+        results.append(item["result"])
+    return results
+
+
+@functools.lru_cache(maxsize=None)
 def load_router(w3: Web3) -> Contract:
     return w3.eth.contract(address=PANCAKE_ROUTER_V2, abi=ROUTER_ABI)
 
 
+@functools.lru_cache(maxsize=4096)
 def load_erc20(w3: Web3, token: str) -> Contract:
     return w3.eth.contract(address=to_checksum(token), abi=ERC20_ABI)
 
 
-def try_get_amount_out(router: Contract, amount_in_wei: int, path: List[str]) -> Optional[int]:
+@functools.lru_cache(maxsize=None)
+def load_multicall(w3: Web3) -> Contract:
+    return w3.eth.contract(address=MULTICALL3, abi=MULTICALL3_ABI)
+
+
+def multicall_aggregate(w3: Web3, calls: List[Tuple[str, str]]) -> List[Optional[bytes]]:
+    """Run (target, calldata) eth_calls in one Multicall3 aggregate3 call; failed calls yield None."""
+    multicall = load_multicall(w3)
+    results = multicall.functions.aggregate3([(target, True, data) for target, data in calls]).call()
+    return [bytes(data) if success else None for success, data in results]
+
+
+class TokenMetaCache:
+    """SQLite-backed (chain_id, address) -> (symbol, decimals) store; one connection per process."""
+
+    def __init__(self, path: str):
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        self._conn = sqlite3.connect(path)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS token ("
+            "chain_id INTEGER, address TEXT, symbol TEXT, decimals INTEGER, "
+            "PRIMARY KEY (chain_id, address))"
+        )
+
+    def get(self, chain_id: int, address: str) -> Optional[Tuple[str, int]]:
+        row = self._conn.execute(
+            "SELECT symbol, decimals FROM token WHERE chain_id = ? AND address = ?", (chain_id, address)
+        ).fetchone()
+        return (row[0], int(row[1])) if row else None
+
+    def put(self, chain_id: int, address: str, symbol: str, decimals: int) -> None:
+        with self._conn:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO token (chain_id, address, symbol, decimals) VALUES (?, ?, ?, ?)",
+                (chain_id, address, symbol, decimals),
+            )
+
+
+@functools.lru_cache(maxsize=None)
+def get_token_meta_cache() -> Optional[TokenMetaCache]:
+    # The cache is an optimisation only; run without it if the file is unusable
     try:
-        out_amounts = router.functions.getAmountsOut(amount_in_wei, path).call()
-        if not out_amounts or len(out_amounts) < 2:
-            return None
-        return int(out_amounts[-1])
-    except (ContractLogicError, ValueError):
+        return TokenMetaCache(TOKEN_CACHE_PATH)
+    except (OSError, sqlite3.Error):
         return None
 
 
-def select_best_path(router: Contract, amount_in_wei: int, token_addr: str) -> Tuple[List[str], int]:
+# In-process memo of (chain_id, address) -> (symbol, decimals), in front of the SQLite cache
+_TOKEN_METADATA: Dict[Tuple[int, str], Tuple[str, int]] = {}
+
+
+def get_cached_token_metadata(w3: Web3, token_addr: str) -> Optional[Tuple[str, int]]:
+    # symbol/decimals never change for a deployed token, so look in memory, then on disk
+    key = (get_chain_id(w3), token_addr)
+    hit = _TOKEN_METADATA.get(key)
+    if hit is None:
+        cache = get_token_meta_cache()
+        if cache is not None:
+            try:
+                hit = cache.get(*key)
+            except sqlite3.Error:
+                hit = None
+        if hit is not None:
+            _TOKEN_METADATA[key] = hit
+    return hit
+
+
+def decode_token_metadata(
+    w3: Web3, token_addr: str, symbol_data: Optional[bytes], decimals_data: Optional[bytes]
+) -> Tuple[str, int]:
+    """Decode symbol()/decimals() return data, caching real values and falling back to ("TOKEN", 18)."""
+    symbol: Optional[str] = None
+    decimals: Optional[int] = None
+    try:
+        if symbol_data:
+            symbol = abi_decode(["string"], symbol_data)[0]
+    except Exception:
+        pass
+    try:
+        if decimals_data:
+            decimals = int(abi_decode(["uint8"], decimals_data)[0])
+    except Exception:
+        pass
+
+    if symbol is None or decimals is None:
+        return (symbol if symbol is not None else "TOKEN"), (decimals if decimals is not None else 18)
+
+    # Only persist real values: an address may simply not be deployed yet
+    key = (get_chain_id(w3), token_addr)
+    _TOKEN_METADATA[key] = (symbol, decimals)
+    cache = get_token_meta_cache()
+    if cache is not None:
+        try:
+            cache.put(*key, symbol, decimals)
+        except sqlite3.Error:
+            pass
+    return symbol, decimals
+
+
+def quote_swap(w3: Web3, router: Contract, amount_in_wei: int, token_addr: str) -> Tuple[str, int, List[str], int]:
+    """Return (symbol, decimals, best_path, expected_out) from a single multicall."""
     token = to_checksum(token_addr)
     candidates: List[List[str]] = [[WBNB, token]]
     for mid in COMMON_INTERMEDIARIES:
         candidates.append([WBNB, mid, token])
 
+    # Quote all candidate paths, plus symbol()/decimals() unless cached, in one multicall;
+    # reverted/unpaired paths come back as None
+    calls = [
+        (router.address, router.encodeABI(fn_name="getAmountsOut", args=[amount_in_wei, path])) for path in candidates
+    ]
+    metadata = get_cached_token_metadata(w3, token)
+    if metadata is None:
+        erc20 = load_erc20(w3, token)
+        calls.append((token, erc20.encodeABI(fn_name="symbol")))
+        calls.append((token, erc20.encodeABI(fn_name="decimals")))
+    results = multicall_aggregate(w3, calls)
+    if metadata is None:
+        metadata = decode_token_metadata(w3, token, *results[len(candidates):])
+
     best_path: Optional[List[str]] = None
     best_out: int = 0
 
-    for path in candidates:
-        out_amount = try_get_amount_out(router, amount_in_wei, path)
-        if out_amount is not None and out_amount > best_out:
+    for path, data in zip(candidates, results):
+        if not data:
+            continue
+        out_amounts = abi_decode(["uint256[]"], data)[0]
+        if not out_amounts or len(out_amounts) < 2:
+            continue
+        out_amount = int(out_amounts[-1])
+        if out_amount > best_out:
             best_out = out_amount
             best_path = path
 
     if not best_path:
         raise RuntimeError("No viable swap path found. Token may be illiquid or not paired.")
 
-    return best_path, best_out
+    symbol, decimals = metadata
+    return symbol, decimals, best_path, best_out
 
 
-def compute_min_out(expected_out: int, slippage_percent_str: str) -> int:
+def slippage_to_bps(slippage_percent_str: str) -> int:
     sl = Decimal(slippage_percent_str)
     if sl < 0 or sl > 100:
         raise ValueError("Slippage must be between 0 and 100")
-    min_out = Decimal(expected_out) * (Decimal(1) - sl / Decimal(100))
-    # round down to int
-    return int(min_out.to_integral_value(rounding="ROUND_DOWN"))
+    # Basis points (10 = 10% -> 1000); sub-bps precision is dropped
+    return int(sl * 100)
+
+
+def compute_min_out(expected_out: int, slippage_percent_str: str) -> int:
+    # Pure integer math, rounds down
+    return expected_out * (10_000 - slippage_to_bps(slippage_percent_str)) // 10_000
 
 
 def derive_sender_from_key(w3: Web3, key_hex: str) -> str:
@@ -176,9 +453,93 @@ def derive_sender_from_key(w3: Web3, key_hex: str) -> str:
     return acct.address
 
 
+async def broadcast_raw_tx(rpc_urls: List[str], raw_tx: bytes, timeout: float) -> HexBytes:
+    """Send a signed tx to every endpoint at once; fail only if all of them reject it."""
+    payload = {"jsonrpc": "2.0", "id": 0, "method": "eth_sendRawTransaction", "params": [Web3.to_hex(raw_tx)]}
+
+    # One session for the whole fan-out, closed before returning
+    async with aiohttp.ClientSession(timeout=aiohttp.ClientTimeout(total=timeout)) as session:
+
+        async def send(url: str) -> Any:
+            async with session.post(url, json=payload) as resp:
+                resp.raise_for_status()
+                return await resp.json(content_type=None)
+
+        # Wait for every endpoint: returning early would cancel sends still connecting
+        responses = await asyncio.gather(*[send(url) for url in rpc_urls], return_exceptions=True)
+
+    accepted: Optional[HexBytes] = None
+    errors = []
+    for url, resp in zip(rpc_urls, responses):
+        if isinstance(resp, BaseException):
+            errors.append(f"{url}: {resp}")
+        elif not isinstance(resp, dict) or "result" not in resp:
+            errors.append(f"{url}: {resp.get('error', resp) if isinstance(resp, dict) else resp}")
+        elif accepted is None:
+            # Same raw tx => same hash on every node that accepts it
+            accepted = HexBytes(resp["result"])
+    if accepted is None:
+        raise RuntimeError(f"All RPC endpoints rejected the transaction: {'; '.join(errors)}")
+    return accepted
+
+
+def try_get_receipt(w3: Web3, tx_hash: bytes) -> Optional[Any]:
+    try:
+        return w3.eth.get_transaction_receipt(tx_hash)
+    except TransactionNotFound:
+        return None
+
+
+async def wait_for_receipt_ws(w3: Web3, ws_url: str, tx_hash: bytes, deadline: float) -> Any:
+    """Check for the receipt once per new block announced over a newHeads subscription (at least every 3 s)."""
+    async with websockets.connect(ws_url) as ws:
+        await ws.send(json.dumps({"jsonrpc": "2.0", "id": 1, "method": "eth_subscribe", "params": ["newHeads"]}))
+        # Capped so an endpoint that never answers still leaves the polling fallback its budget
+        reply = json.loads(await asyncio.wait_for(ws.recv(), timeout=min(max(deadline - time.monotonic(), 0), 3.0)))
+        if "error" in reply or "result" not in reply:
+            # Endpoint without subscription support: no heads will ever arrive
+            raise ValueError(f"eth_subscribe failed: {reply.get('error', reply)}")
+        while True:
+            # Checked before the first head too, in case the tx mined while subscribing
+            receipt = try_get_receipt(w3, tx_hash)
+            if receipt is not None:
+                return receipt
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                raise TimeExhausted(f"Transaction {tx_hash.hex()} not in chain after timeout")
+            try:
+                # Capped at one BSC block so a silent subscription still degrades to polling
+                await asyncio.wait_for(ws.recv(), timeout=min(remaining, 3.0))
+            except asyncio.TimeoutError:
+                pass
+
+
+def wait_for_receipt_polling(w3: Web3, tx_hash: bytes, deadline: float) -> Any:
+    """Poll for the receipt with exponential backoff (0.25 s doubling up to BSC's ~3 s block time)."""
+    delay = 0.25
+    while True:
+        receipt = try_get_receipt(w3, tx_hash)
+        if receipt is not None:
+            return receipt
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            raise TimeExhausted(f"Transaction {tx_hash.hex()} not in chain after timeout")
+        time.sleep(min(delay, remaining))
+        delay = min(delay * 2, 3.0)
+
+
+def wait_for_receipt(w3: Web3, tx_hash: bytes, timeout: float, ws_url: Optional[str]) -> Any:
+    deadline = time.monotonic() + timeout
+    if ws_url:
+        try:
+            return asyncio.run(wait_for_receipt_ws(w3, ws_url, tx_hash, deadline))
+        except (OSError, ValueError, asyncio.TimeoutError, websockets.exceptions.WebSocketException) as e:
+            print(f"[WARN] WebSocket receipt wait failed ({e}); falling back to polling")
+    return wait_for_receipt_polling(w3, tx_hash, deadline)
+
+
 def build_and_send_swap(
     w3: Web3,
-    router: Contract,
     sender: str,
     key_hex: str,
     amount_in_wei: int,
@@ -189,56 +550,69 @@ def build_and_send_swap(
     gas_price_gwei: Optional[str],
     nonce_override: Optional[int],
     wait: bool,
+    estimate_gas: bool = True,
+    ws_url: Optional[str] = None,
+    broadcast_urls: Optional[List[str]] = None,
 ) -> str:
-    # Base tx parameters
-    tx_params = {
-        "from": sender,
-        "value": amount_in_wei,
-    }
-
-    # Build function call
-    func = router.functions.swapExactETHForTokensSupportingFeeOnTransferTokens(
-        amount_out_min, path, recipient, deadline_ts
+    # Encode calldata directly from the precomputed selector
+    data = SWAP_ETH_FOR_TOKENS_SELECTOR + abi_encode(
+        ["uint256", "address[]", "address", "uint256"], [amount_out_min, path, recipient, deadline_ts]
     )
 
-    # First build minimal tx for gas estimation
-    built = func.build_transaction({"from": sender, "value": amount_in_wei})
-
-    # Estimate gas (fallback to a safe ceiling on failure)
-    try:
-        estimated_gas = w3.eth.estimate_gas(built)
-        gas_limit = int(estimated_gas * 1.2)  # add headroom
-    except Exception:
-        gas_limit = 500_000
+    # Gas price (legacy gasPrice for BNB Chain) and nonce: fetch whatever is not
+    # overridden in a single batched round-trip
+    calls: List[Tuple[str, list]] = []
+    if gas_price_gwei is None:
+        calls.append(("eth_gasPrice", []))
+    if nonce_override is None:
+        calls.append(("eth_getTransactionCount", [sender, "latest"]))
+    fetched = [int(v, 16) for v in rpc_batch(w3, calls)] if calls else []
 
-    # Gas price handling (use legacy gasPrice for BNB Chain)
     if gas_price_gwei is not None:
         gas_price = int(Decimal(gas_price_gwei) * (10 ** 9))
     else:
-        gas_price = w3.eth.gas_price
-
-    nonce = nonce_override if nonce_override is not None else w3.eth.get_transaction_count(sender)
-
-    tx = func.build_transaction(
-        {
-            "from": sender,
-            "value": amount_in_wei,
-            "gas": gas_limit,
-            "gasPrice": gas_price,
-            "nonce": nonce,
-            "chainId": w3.eth.chain_id,
-        }
-    )
+        gas_price = fetched.pop(0)
+
+    nonce = nonce_override if nonce_override is not None else fetched.pop(0)
+
+    # Build once with a safe gas ceiling, then patch in the estimate
+    tx = {
+        "from": sender,
+        "to": PANCAKE_ROUTER_V2,
+        "value": amount_in_wei,
+        "data": Web3.to_hex(data),
+        "gas": 500_000,
+        "gasPrice": gas_price,
+        "nonce": nonce,
+        "chainId": get_chain_id(w3),
+    }
+
+    # Estimate gas (keep the ceiling on failure or when skipped)
+    if estimate_gas:
+        try:
+            # Drop the placeholder so it does not cap the estimate
+            estimated_gas = w3.eth.estimate_gas({k: v for k, v in tx.items() if k != "gas"})
+            tx["gas"] = int(estimated_gas * 1.2)  # add headroom
+        except Exception:
+            pass
 
     signed = w3.eth.account.sign_transaction(tx, private_key=key_hex)
-    tx_hash = w3.eth.send_raw_transaction(signed.rawTransaction)
+    if broadcast_urls:
+        timeout = dict(w3.provider.get_request_kwargs()).get("timeout", 5)
+        tx_hash = asyncio.run(
+            broadcast_raw_tx([w3.provider.endpoint_uri] + broadcast_urls, signed.rawTransaction, timeout)
+        )
+    else:
+        tx_hash = HexBytes(
+            rpc_call(w3, "eth_sendRawTransaction", [Web3.to_hex(signed.rawTransaction)], session=_SEND_SESSION)
+        )
     hex_hash = tx_hash.hex()
 
     print(f"Sent swap tx: {hex_hash}")
 
     if wait:
         print("Waiting for receipt...")
-        receipt = w3.eth.wait_for_transaction_receipt(tx_hash, timeout=180)
+        receipt = wait_for_receipt(w3, tx_hash, timeout=180, ws_url=ws_url)
         status = receipt.status
         print(f"Receipt status: {status}, gasUsed={receipt.gasUsed}")
         if status != 1:
@@ -256,36 +630,33 @@ def main():
         sys.exit(2)
 
     # Connect
-    w3 = connect_web3(args.rpc)
+    w3 = connect_web3(args.rpc, args.rpc_timeout)
     router = load_router(w3)
 
     token_addr = to_checksum(args.token)
-    token = load_erc20(w3, token_addr)
-
-    # Read metadata for display (non-critical)
-    try:
-        token_symbol = token.functions.symbol().call()
-    except Exception:
-        token_symbol = "TOKEN"
-    try:
-        token_decimals = int(token.functions.decimals().call())
-    except Exception:
-        token_decimals = 18
 
     amount_in_wei = bnb_to_wei(args.amount_bnb)
     deadline = int(time.time()) + int(args.deadline_seconds)
 
-    # Select best path
-    path, expected_out = select_best_path(router, amount_in_wei, token_addr)
-    min_out = compute_min_out(expected_out, args.slippage)
+    if args.aggressive:
+        # Critical path: no metadata, quote or slippage lookups before signing
+        token_symbol = "TOKEN"
+        path, expected_out, min_out = [WBNB, token_addr], None, 0
+    else:
+        # Path quotes and display metadata in one round-trip
+        token_symbol, token_decimals, path, expected_out = quote_swap(w3, router, amount_in_wei, token_addr)
+        min_out = compute_min_out(expected_out, args.slippage)
 
     # Pretty print preview
     print("--- Trade Preview ---")
     print(f"RPC: {args.rpc}")
     print(f"Token: {token_addr} ({token_symbol})")
     print(f"Amount In (BNB): {args.amount_bnb}")
-    print(f"Expected Out (~{token_symbol}): {expected_out / (10 ** token_decimals):.6f}")
-    print(f"Min Out (slippage {args.slippage}%): {min_out / (10 ** token_decimals):.6f}")
+    if expected_out is None:
+        print("Aggressive mode: no quote, Min Out = 0")
+    else:
+        print(f"Expected Out (~{token_symbol}): {expected_out / (10 ** token_decimals):.6f}")
+        print(f"Min Out (slippage {args.slippage}%): {min_out / (10 ** token_decimals):.6f}")
     print("Path:")
     for hop in path:
         print(f"  - {hop}")
@@ -297,13 +668,14 @@ def main():
     sender = derive_sender_from_key(w3, key)
     recipient = to_checksum(args.recipient) if args.recipient else sender
 
+    broadcast_urls = [u.strip() for u in (args.broadcast_rpc or "").split(",") if u.strip() and u.strip() != args.rpc]
+
     print(f"Sender:   {sender}")
     print(f"Recipient:{recipient}")
 
     try:
         tx_hash = build_and_send_swap(
             w3=w3,
-            router=router,
             sender=sender,
             key_hex=key,
             amount_in_wei=amount_in_wei,
@@ -314,6 +686,9 @@ def main():
             gas_price_gwei=args.gas_price_gwei,
             nonce_override=args.nonce,
             wait=(not args.no_wait),
+            estimate_gas=(not args.aggressive),
+            ws_url=args.ws_rpc,
+            broadcast_urls=broadcast_urls,
         )
         print(f"Success! Tx hash: {tx_hash}")
     except Exception as e: